@@ -7,9 +7,129 @@ Analyzes Avalonia project structure and identifies missing files/resources
 import os
 import sys
 import re
+import codecs
+from itertools import combinations
 from pathlib import Path
-from typing import List, Dict, Set, Optional
-import xml.etree.ElementTree as ET
+from typing import List, Dict, Set, Optional, Tuple
+
+# Prefer lxml for .csproj parsing when it is installed, with the element
+# lookups compiled once; otherwise stream the file with the stdlib parser
+try:
+    from lxml import etree as ET
+    _PACKAGE_REF_XPATH = ET.XPath('//*[local-name()="PackageReference"]')
+    _USE_AVALONIA_XPATH = ET.XPath('//*[local-name()="UseAvalonia"]')
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _PACKAGE_REF_XPATH = _USE_AVALONIA_XPATH = None
+
+_TYPO_FIXES = {
+    b"ColumnDefinin": "ColumnDefinitions",
+    b"RowDefinin": "RowDefinitions",
+    b"MultiClass": "Classes",
+}
+
+# Unsupported StackPanel properties in Avalonia 11.0.7 and the issue reported for each
+_UNSUPPORTED_STACKPANEL_PROPS = {
+    b"ColumnGap": "ColumnGap not supported in Avalonia 11.0.7 (use Margin instead)",
+    b"RowGap": "RowGap not supported in Avalonia 11.0.7 (use Margin instead)",
+    b"Padding": "StackPanel doesn't support Padding (use Border instead)",
+}
+
+# <StackPanel> opening tags that set one of the given unsupported properties,
+# keyed by the tuple of properties still being looked for. [^>] keeps every
+# match inside a single tag, so the lazy scan stays linear.
+_SP_BAD = {
+    props: re.compile(
+        rb'<StackPanel\s[^>]*?\b(?P<prop>' + b'|'.join(map(re.escape, props)) + rb')='
+    )
+    for count in range(1, len(_UNSUPPORTED_STACKPANEL_PROPS) + 1)
+    for props in combinations(_UNSUPPORTED_STACKPANEL_PROPS, count)
+}
+
+# Byte order marks of encodings the XAML checks can't scan as UTF-8
+_UTF16_BOMS = (codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)
+
+# .axaml files above this size are reported and skipped instead of scanned
+_MAX_XAML_BYTES = 8 * 1024 * 1024
+
+# Source="..." attribute values (StyleInclude/ResourceInclude paths)
+_STYLE_SRC = re.compile(rb'Source="([^"]+)"')
+
+# Namespace the x:Class of a root-level .axaml file is expected to be in
+_ROOT_NAMESPACE = "JobFinderApp.Desktop"
+
+def _walk_tree(root, namespace: Optional[str] = None):
+    """Recursively yield (DirEntry, folder namespace) for every entry under root"""
+    # When a namespace is given, each subfolder extends it with its own name,
+    # so callers get the namespace of an entry's folder without path arithmetic
+    stack = [(root, namespace)]
+    while stack:
+        dir_path, dir_namespace = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        child_namespace = None if dir_namespace is None else f"{dir_namespace}.{entry.name}"
+                        stack.append((entry.path, child_namespace))
+                    yield entry, dir_namespace
+        except OSError:
+            continue
+
+def _scan_ext(root, suffix: str):
+    """Recursively yield DirEntry objects for files under root ending with suffix"""
+    suffix = os.path.normcase(suffix)
+    for entry, _ in _walk_tree(root):
+        if not entry.is_dir(follow_symlinks=False) and os.path.normcase(entry.name).endswith(suffix):
+            yield entry
+
+def _walk_xaml(root, namespace: str):
+    """Recursively yield (DirEntry, expected x:Class) for .axaml files under root"""
+    for entry, dir_namespace in _walk_tree(root, namespace):
+        if not entry.is_dir(follow_symlinks=False) and os.path.normcase(entry.name).endswith(".axaml"):
+            yield entry, f"{dir_namespace}.{entry.name[:-len('.axaml')]}"
+
+def _count_with_suffix(folder, suffix: str) -> int:
+    """Count files directly inside folder ending with suffix"""
+    suffix = os.path.normcase(suffix)
+    count = 0
+    try:
+        with os.scandir(folder) as it:
+            for entry in it:
+                if os.path.normcase(entry.name).endswith(suffix) and entry.is_file():
+                    count += 1
+    except OSError:
+        return 0
+    return count
+
+def _classify_obj(root) -> Tuple[int, bool]:
+    """Count generated *.g.cs files and look for Avalonia build cache entries in one walk"""
+    generated_count = 0
+    has_avalonia_cache = False
+    for entry, _ in _walk_tree(root):
+        name = entry.name
+        if not has_avalonia_cache and "avalonia" in name.lower():
+            has_avalonia_cache = True
+        if not entry.is_dir(follow_symlinks=False) and os.path.normcase(name).endswith(".g.cs"):
+            generated_count += 1
+    return generated_count, has_avalonia_cache
+
+def _find_stackpanel_props(content: bytes):
+    """Yield (prop, offset) for the first use of each unsupported property on a <StackPanel> tag"""
+    # Only properties whose name occurs at all are looked for, which a plain
+    # substring test settles far faster than the regex. Each search covers
+    # the whole file; a hit drops its property from the pattern, and the scan
+    # ends once all of them have been found.
+    remaining = tuple(prop for prop in _UNSUPPORTED_STACKPANEL_PROPS if prop + b'=' in content)
+    pos = 0
+    while remaining:
+        match = _SP_BAD[remaining].search(content, pos)
+        if match is None:
+            return
+        prop = match.group("prop")
+        yield prop, match.start("prop")
+        remaining = tuple(p for p in remaining if p != prop)
+        # The same tag may set another of the properties, so search again from it
+        pos = match.start()
 
 class AvaloniaProjectAnalyzer:
     def __init__(self, project_path: str):
@@ -17,12 +137,15 @@ class AvaloniaProjectAnalyzer:
         self.issues = []
         self.warnings = []
         self.info = []
+        self._content_cache: Dict[str, bytes] = {}
+        self._root_entries: Optional[Dict[str, os.DirEntry]] = None
         
     def analyze(self):
         """Run complete project analysis"""
         print("🔍 AVALONIA PROJECT DIAGNOSTIC ANALYSIS")
         print("=" * 60)
         
+        self._scan_root()
         self.check_project_structure()
         self.check_csproj_file()
         self.check_xaml_files()
@@ -43,49 +166,63 @@ class AvaloniaProjectAnalyzer:
         ]
         
         for pattern in required_files:
-            matching_files = list(self.project_path.glob(pattern))
-            if not matching_files:
+            if pattern.startswith("*"):
+                matching_names = [entry.name for entry in self._root_files_with_suffix(pattern[1:])]
+            else:
+                matching_names = [pattern] if self._root_path(pattern) else []
+            if not matching_names:
                 self.issues.append(f"Missing required file: {pattern}")
             else:
-                self.info.append(f"Found: {matching_files[0].name}")
+                self.info.append(f"Found: {matching_names[0]}")
                 
         # Check Views folder
-        views_folder = self.project_path / "Views"
-        if not views_folder.exists():
+        views_folder = self._root_path("Views", is_dir=True)
+        if views_folder is None:
             self.warnings.append("Views folder doesn't exist")
         else:
-            view_files = list(views_folder.glob("*.axaml"))
-            self.info.append(f"Found {len(view_files)} view files")
+            self.info.append(f"Found {_count_with_suffix(views_folder, '.axaml')} view files")
             
         # Check Controls folder
-        controls_folder = self.project_path / "Controls"
-        if controls_folder.exists():
-            control_files = list(controls_folder.glob("*.axaml"))
-            self.info.append(f"Found {len(control_files)} control files")
+        controls_folder = self._root_path("Controls", is_dir=True)
+        if controls_folder is not None:
+            self.info.append(f"Found {_count_with_suffix(controls_folder, '.axaml')} control files")
             
     def check_csproj_file(self):
         """Analyze .csproj file for issues"""
         print("🔧 Checking project file...")
         
-        csproj_files = list(self.project_path.glob("*.csproj"))
+        csproj_files = self._root_files_with_suffix(".csproj")
         if not csproj_files:
             self.issues.append("No .csproj file found")
             return
             
-        csproj_path = csproj_files[0]
+        csproj_path = csproj_files[0].path
         try:
-            tree = ET.parse(csproj_path)
-            root = tree.getroot()
-            
+            package_refs = []
+            use_avalonia_seen = False
+            use_avalonia_value = None
+            if _PACKAGE_REF_XPATH is not None:
+                root = ET.parse(csproj_path).getroot()
+                package_refs = [(elem.get("Include", ""), elem.get("Version", "Unknown"))
+                                for elem in _PACKAGE_REF_XPATH(root)]
+                use_avalonia = _USE_AVALONIA_XPATH(root)
+                if use_avalonia:
+                    use_avalonia_seen = True
+                    use_avalonia_value = use_avalonia[0].text
+            else:
+                # Stream the project file instead of building the whole tree
+                for _, elem in ET.iterparse(csproj_path, events=("end",)):
+                    tag = elem.tag.rsplit("}", 1)[-1]
+                    if tag == "PackageReference":
+                        package_refs.append((elem.get("Include", ""), elem.get("Version", "Unknown")))
+                    elif tag == "UseAvalonia" and not use_avalonia_seen:
+                        use_avalonia_seen = True
+                        use_avalonia_value = elem.text
+                    elem.clear()
+                    
             # Check Avalonia packages
-            avalonia_packages = []
-            for item_group in root.findall(".//ItemGroup"):
-                for package_ref in item_group.findall("PackageReference"):
-                    include = package_ref.get("Include", "")
-                    if "Avalonia" in include:
-                        version = package_ref.get("Version", "Unknown")
-                        avalonia_packages.append(f"{include} v{version}")
-                        
+            avalonia_packages = [f"{include} v{version}"
+                                 for include, version in package_refs if "Avalonia" in include]
             if avalonia_packages:
                 self.info.append("Avalonia packages:")
                 for pkg in avalonia_packages:
@@ -94,10 +231,9 @@ class AvaloniaProjectAnalyzer:
                 self.issues.append("No Avalonia packages found in project file")
                 
             # Check for UseAvalonia property
-            use_avalonia = root.find(".//UseAvalonia")
-            if use_avalonia is None:
+            if not use_avalonia_seen:
                 self.warnings.append("UseAvalonia property not found in project file")
-            elif use_avalonia.text != "true":
+            elif use_avalonia_value != "true":
                 self.issues.append("UseAvalonia property is not set to true")
                 
         except ET.ParseError as e:
@@ -107,114 +243,142 @@ class AvaloniaProjectAnalyzer:
         """Check all XAML files for issues"""
         print("📄 Checking XAML files...")
         
-        xaml_files = list(self.project_path.rglob("*.axaml"))
+        xaml_files = list(_walk_xaml(self.project_path, _ROOT_NAMESPACE))
         self.info.append(f"Found {len(xaml_files)} XAML files")
         
-        for xaml_file in xaml_files:
-            self.check_single_xaml_file(xaml_file)
+        for xaml_file, expected_class in xaml_files:
+            issues, warnings = self.check_single_xaml_file(xaml_file, expected_class)
+            self.issues.extend(issues)
+            self.warnings.extend(warnings)
             
-    def check_single_xaml_file(self, xaml_file: Path):
-        """Check individual XAML file for common issues"""
+    def check_single_xaml_file(self, xaml_file: os.DirEntry, expected_class: str) -> Tuple[List[str], List[str]]:
+        """Check individual XAML file for common issues, returning (issues, warnings)"""
+        issues = []
+        warnings = []
         try:
-            content = xaml_file.read_text(encoding='utf-8')
+            # Only App.axaml is read again later, so only it is kept in the cache
+            reused = xaml_file.path == self._root_path("App.axaml")
+            content = self._read(xaml_file.path, cache=reused, max_size=_MAX_XAML_BYTES)
+            if content is None:
+                warnings.append(f"{xaml_file.name}: Skipped, file is larger than {_MAX_XAML_BYTES // (1024 * 1024)} MiB")
+                return issues, warnings
             
+            # Check for encoding; the checks below scan the raw bytes as UTF-8
+            if content.startswith(_UTF16_BOMS):
+                issues.append(f"{xaml_file.name}: File is UTF-16 encoded (save it as UTF-8)")
+                return issues, warnings
+            if not content.isascii():
+                # Invalid UTF-8 raises here and is reported as a read failure below
+                content.decode('utf-8')
+                
             # Check for empty files
             if not content.strip():
-                self.issues.append(f"{xaml_file.name}: File is empty")
-                return
+                issues.append(f"{xaml_file.name}: File is empty")
+                return issues, warnings
                 
             # Check for root element
-            if not content.strip().startswith('<'):
-                self.issues.append(f"{xaml_file.name}: No root element")
-                return
+            if not content.strip().startswith(b'<'):
+                issues.append(f"{xaml_file.name}: No root element")
+                return issues, warnings
                 
-            # Check for common typos
-            typos = [
-                ("ColumnDefinin", "ColumnDefinitions"),
-                ("RowDefinin", "RowDefinitions"),
-                ("MultiClass", "Classes"),
-            ]
-            
-            for typo, correct in typos:
-                if typo in content:
-                    line_num = self.find_line_number(content, typo)
-                    self.issues.append(f"{xaml_file.name}:{line_num}: Found '{typo}' (should be '{correct}')")
+            # Check for common typos; bytes.find uses CPython's fast substring
+            # search, which beats a regex alternation of the same literals
+            for typo, correct in _TYPO_FIXES.items():
+                index = content.find(typo)
+                if index >= 0:
+                    line_num = content.count(b'\n', 0, index) + 1
+                    issues.append(f"{xaml_file.name}:{line_num}: Found '{typo.decode()}' (should be '{correct}')")
                     
             # Check for unsupported properties in Avalonia 11.0.7
-            unsupported_props = [
-                "ColumnGap", "RowGap", "Padding"
-            ]
-            
-            for prop in unsupported_props:
-                pattern = f'<StackPanel[^>]*{prop}='
-                if re.search(pattern, content):
-                    line_num = self.find_line_number(content, pattern)
-                    if prop == "Padding":
-                        self.issues.append(f"{xaml_file.name}:{line_num}: StackPanel doesn't support Padding (use Border instead)")
-                    else:
-                        self.issues.append(f"{xaml_file.name}:{line_num}: {prop} not supported in Avalonia 11.0.7 (use Margin instead)")
-                        
+            for prop, offset in _find_stackpanel_props(content):
+                line_num = content.count(b'\n', 0, offset) + 1
+                issues.append(f"{xaml_file.name}:{line_num}: {_UNSUPPORTED_STACKPANEL_PROPS[prop]}")
+                    
             # Check x:Class declarations
-            class_match = re.search(r'x:Class="([^"]+)"', content)
-            if class_match:
-                declared_class = class_match.group(1)
-                expected_class = self.get_expected_class_name(xaml_file)
-                if expected_class and declared_class != expected_class:
-                    self.warnings.append(f"{xaml_file.name}: x:Class '{declared_class}' might not match file location (expected '{expected_class}')")
+            start = content.find(b'x:Class="')
+            if start >= 0:
+                start += len(b'x:Class="')
+                end = content.find(b'"', start)
+                if end > start:
+                    declared_class = content[start:end].decode('utf-8', 'replace')
+                    if declared_class != expected_class:
+                        warnings.append(f"{xaml_file.name}: x:Class '{declared_class}' might not match file location (expected '{expected_class}')")
                     
         except Exception as e:
-            self.issues.append(f"{xaml_file.name}: Failed to read file - {e}")
+            issues.append(f"{xaml_file.name}: Failed to read file - {e}")
+        return issues, warnings
             
-    def get_expected_class_name(self, xaml_file: Path) -> Optional[str]:
-        """Get expected class name based on file location"""
-        relative_path = xaml_file.relative_to(self.project_path)
-        parts = list(relative_path.parts[:-1])  # Remove filename
+    def _root_path(self, name: str, is_dir: bool = False) -> Optional[str]:
+        """Return the path of a direct child of the project folder, if present"""
+        if self._root_entries is None:
+            self._scan_root()
+        entry = self._root_entries.get(os.path.normcase(name))
+        if entry is None or entry.is_dir() != is_dir:
+            return None
+        return entry.path
         
-        # Remove file extension
-        class_name = xaml_file.stem
+    def _root_files_with_suffix(self, suffix: str) -> List[os.DirEntry]:
+        """Return files directly inside the project folder ending with suffix"""
+        if self._root_entries is None:
+            self._scan_root()
+        suffix = os.path.normcase(suffix)
+        return [entry for key, entry in self._root_entries.items()
+                if key.endswith(suffix) and entry.is_file()]
         
-        # Build namespace
-        if parts:
-            namespace = "JobFinderApp.Desktop." + ".".join(parts)
-        else:
-            namespace = "JobFinderApp.Desktop"
+    def _scan_root(self):
+        """List the project folder once; DirEntry caches the file type for later checks"""
+        # Keyed by normcase'd name so lookups are case-insensitive on Windows,
+        # like the exists()/glob() calls they replace
+        try:
+            with os.scandir(self.project_path) as it:
+                self._root_entries = {os.path.normcase(entry.name): entry for entry in it}
+        except OSError:
+            self._root_entries = {}
             
-        return f"{namespace}.{class_name}"
-        
-    def find_line_number(self, content: str, search_term: str) -> int:
-        """Find line number of search term in content"""
-        lines = content.split('\n')
-        for i, line in enumerate(lines, 1):
-            if search_term in line:
-                return i
-        return 0
+    def _read(self, path: str, cache: bool = True, max_size: Optional[int] = None) -> Optional[bytes]:
+        """Read file bytes, keeping them for later checks when cache is set"""
+        content = self._content_cache.get(path)
+        if content is None:
+            with open(path, 'rb') as f:
+                # Files over max_size are not read; the size comes from the
+                # open handle, so the check adds no extra path lookup
+                if max_size is not None and os.fstat(f.fileno()).st_size > max_size:
+                    return None
+                content = f.read()
+            if cache:
+                self._content_cache[path] = content
+        return content
         
     def check_resources(self):
         """Check for resource files and references"""
         print("🖼️  Checking resources...")
         
         # Check Assets folder
-        assets_folder = self.project_path / "Assets"
-        if assets_folder.exists():
-            asset_files = list(assets_folder.rglob("*"))
-            asset_files = [f for f in asset_files if f.is_file()]
-            self.info.append(f"Found {len(asset_files)} asset files")
+        assets_folder = self._root_path("Assets", is_dir=True)
+        if assets_folder is not None:
+            asset_count = sum(1 for entry, _ in _walk_tree(assets_folder) if entry.is_file())
+            self.info.append(f"Found {asset_count} asset files")
         else:
             self.warnings.append("No Assets folder found")
             
         # Check Styles folder
-        styles_folder = self.project_path / "Styles"
-        if styles_folder.exists():
-            style_files = list(styles_folder.glob("*.axaml"))
+        styles_folder = self._root_path("Styles", is_dir=True)
+        if styles_folder is not None:
+            style_files = list(Path(styles_folder).glob("*.axaml"))
             self.info.append(f"Found {len(style_files)} style files")
             
             # Check for missing style references
-            app_xaml = self.project_path / "App.axaml"
-            if app_xaml.exists():
-                app_content = app_xaml.read_text(encoding='utf-8')
+            app_xaml = self._root_path("App.axaml")
+            if app_xaml is not None:
+                # Index the Source="..." references once, keyed by their last two
+                # path segments so avares:// and relative forms both match
+                referenced = {
+                    b"/".join(source.replace(b"\\", b"/").rsplit(b"/", 2)[-2:])
+                    for source in _STYLE_SRC.findall(self._read(app_xaml))
+                }
                 for style_file in style_files:
-                    style_ref = f"Styles/{style_file.name}"
-                    if style_ref not in app_content:
+                    style_ref = f"Styles/{style_file.name}".encode()
+                    if style_ref not in referenced:
                         self.warnings.append(f"Style file {style_file.name} not referenced in App.axaml")
         else:
             self.info.append("No Styles folder found")
@@ -223,23 +387,24 @@ class AvaloniaProjectAnalyzer:
         """Check App.axaml and App.axaml.cs specifically"""
         print("🚀 Checking application files...")
         
-        app_xaml = self.project_path / "App.axaml"
-        app_cs = self.project_path / "App.axaml.cs"
+        app_xaml = self._root_path("App.axaml")
+        app_cs = self._root_path("App.axaml.cs")
         
-        if app_xaml.exists():
+        if app_xaml is not None:
             try:
-                content = app_xaml.read_text(encoding='utf-8')
+                content = self._read(app_xaml)
                 if not content.strip():
                     self.issues.append("App.axaml is empty")
-                elif not "Application" in content:
+                elif not b"Application" in content:
                     self.issues.append("App.axaml doesn't contain Application root element")
                 else:
                     self.info.append("App.axaml looks valid")
                     
                 # Check for missing style includes
-                if "StyleInclude" in content:
-                    style_includes = re.findall(r'Source="([^"]+)"', content)
+                if b"StyleInclude" in content:
+                    style_includes = _STYLE_SRC.findall(content)
                     for style_path in style_includes:
+                        style_path = style_path.decode('utf-8', 'replace')
                         full_path = self.project_path / style_path
                         if not full_path.exists():
                             self.issues.append(f"App.axaml references missing style: {style_path}")
@@ -249,10 +414,10 @@ class AvaloniaProjectAnalyzer:
         else:
             self.issues.append("App.axaml not found")
             
-        if app_cs.exists():
+        if app_cs is not None:
             try:
-                content = app_cs.read_text(encoding='utf-8')
-                if "InitializeComponent" not in content:
+                content = Path(app_cs).read_bytes()
+                if b"InitializeComponent" not in content:
                     self.warnings.append("App.axaml.cs doesn't call InitializeComponent()")
                 self.info.append("App.axaml.cs exists")
             except Exception as e:
@@ -265,61 +430,66 @@ class AvaloniaProjectAnalyzer:
         print("🔨 Checking build artifacts...")
         
         # Check obj folder
-        obj_folder = self.project_path / "obj"
-        if obj_folder.exists():
-            # Look for generated files
-            generated_files = list(obj_folder.rglob("*.g.cs"))
-            if generated_files:
-                self.info.append(f"Found {len(generated_files)} generated code files")
+        obj_folder = self._root_path("obj", is_dir=True)
+        if obj_folder is not None:
+            # Look for generated files and the Avalonia cache in a single walk
+            generated_count, has_avalonia_cache = _classify_obj(obj_folder)
+            if generated_count:
+                self.info.append(f"Found {generated_count} generated code files")
             else:
                 self.warnings.append("No generated code files found (XAML might not be compiling)")
                 
             # Check for Avalonia cache
-            avalonia_cache = list(obj_folder.rglob("*avalonia*"))
-            if avalonia_cache:
+            if has_avalonia_cache:
                 self.info.append("Avalonia build cache exists")
         else:
             self.warnings.append("No obj folder found (project hasn't been built)")
             
         # Check bin folder
-        bin_folder = self.project_path / "bin"
-        if bin_folder.exists():
-            exe_files = list(bin_folder.rglob("*.exe"))
-            if exe_files:
-                self.info.append(f"Found {len(exe_files)} executable files")
+        bin_folder = self._root_path("bin", is_dir=True)
+        if bin_folder is not None:
+            exe_count = sum(1 for _ in _scan_ext(bin_folder, ".exe"))
+            if exe_count:
+                self.info.append(f"Found {exe_count} executable files")
         else:
             self.warnings.append("No bin folder found")
             
     def print_results(self):
         """Print analysis results"""
-        print("\n" + "=" * 60)
-        print("📊 ANALYSIS RESULTS")
-        print("=" * 60)
+        # Collect every line and write once instead of one print() per entry
+        out = []
+        ap = out.append
+        ap("\n" + "=" * 60)
+        ap("📊 ANALYSIS RESULTS")
+        ap("=" * 60)
         
         if self.issues:
-            print(f"\n❌ CRITICAL ISSUES ({len(self.issues)}):")
+            ap(f"\n❌ CRITICAL ISSUES ({len(self.issues)}):")
             for i, issue in enumerate(self.issues, 1):
-                print(f"   {i}. {issue}")
+                ap(f"   {i}. {issue}")
                 
         if self.warnings:
-            print(f"\n⚠️  WARNINGS ({len(self.warnings)}):")
+            ap(f"\n⚠️  WARNINGS ({len(self.warnings)}):")
             for i, warning in enumerate(self.warnings, 1):
-                print(f"   {i}. {warning}")
+                ap(f"   {i}. {warning}")
                 
         if self.info:
-            print(f"\n✅ INFO ({len(self.info)}):")
+            ap(f"\n✅ INFO ({len(self.info)}):")
             for i, info in enumerate(self.info, 1):
-                print(f"   {i}. {info}")
+                ap(f"   {i}. {info}")
                 
-        print(f"\n🎯 SUMMARY:")
-        print(f"   Issues: {len(self.issues)} | Warnings: {len(self.warnings)} | Info: {len(self.info)}")
+        ap(f"\n🎯 SUMMARY:")
+        ap(f"   Issues: {len(self.issues)} | Warnings: {len(self.warnings)} | Info: {len(self.info)}")
         
         if self.issues:
-            print(f"\n🔧 RECOMMENDED ACTIONS:")
-            print("   1. Fix all critical issues first")
-            print("   2. Address warnings that might affect functionality")
-            print("   3. Clean and rebuild project")
-            print("   4. Test application startup")
+            ap(f"\n🔧 RECOMMENDED ACTIONS:")
+            ap("   1. Fix all critical issues first")
+            ap("   2. Address warnings that might affect functionality")
+            ap("   3. Clean and rebuild project")
+            ap("   4. Test application startup")
+            
+        ap("")
+        sys.stdout.write("\n".join(out))
 
 def main():
     if len(sys.argv) > 1: